@@ -2,6 +2,7 @@ import os
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
+from utilsmessage_formatting import EmbedTemplate
 
 load_dotenv()
 
@@ -51,13 +52,8 @@ async def on_member_join(member):
     except discord.HTTPException as e:
         print(f"⚠️ Failed to assign role to {member.display_name}: {e}")
 
-async def send_server_info():
-    """Send a beautiful server info embed"""
-    channel = bot.get_channel(CHANNEL_ID)
-    if not channel:
-        print("⚠️ Server info channel not found")
-        return
-    
+def build_server_info_embed():
+    """Build the static server info embed (timestamp is added per send)"""
     # Create a stunning embed with modern design
     embed = discord.Embed(
         title="🎴 Welcome to PokeBrief TCG!",
@@ -107,8 +103,20 @@ async def send_server_info():
     
     embed.set_thumbnail(url="https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/items/ultra-ball.png")
     
-    # Add a subtle timestamp
-    embed.timestamp = discord.utils.utcnow()
+    return embed
+
+# Pre-built once; cloned with a fresh timestamp on every send
+SERVER_INFO_TEMPLATE = EmbedTemplate(build_server_info_embed())
+
+async def send_server_info():
+    """Send a beautiful server info embed"""
+    channel = bot.get_channel(CHANNEL_ID)
+    if not channel:
+        print("⚠️ Server info channel not found")
+        return
+    
+    # Clone the pre-built embed with a subtle timestamp
+    embed = SERVER_INFO_TEMPLATE.render(timestamp=discord.utils.utcnow())
     
     try:
         await channel.send(embed=embed)
@@ -4,11 +4,16 @@ import aiohttp
 import asyncio
 import logging
 import json
+import time
 import base64
 from discord.ext import commands
 from datetime import datetime, timezone, timedelta
 from statistics import mean
 from dotenv import load_dotenv
+from card_catalog import resolve_card
+from utilsmessage_formatting import EmbedTemplate
+from response_cache import make_key, get_cached, set_cached, cache_stats
+from price_trends import record_price, get_trend, describe_price_move, format_span
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -47,10 +52,22 @@ intents = discord.Intents.default()
 intents.message_content = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 
+# Display labels for each searched condition
+CONDITION_LABELS = {
+    'raw': '🎴 Raw/Ungraded',
+    'psa_9': '🥈 PSA 9',
+    'psa_10': '🥇 PSA 10'
+}
+
 # Global OAuth token storage
 oauth_token = None
 token_expires_at = None
 
+# Rate limiting for Browse API calls (cache hits are not throttled)
+EBAY_SEARCH_INTERVAL = 1.0
+last_search_at = 0.0
+search_throttle = asyncio.Lock()
+
 async def get_oauth_token():
     """Get OAuth 2.0 token from eBay"""
     global oauth_token, token_expires_at
@@ -89,8 +106,23 @@ async def get_oauth_token():
         logger.error(f"❌ OAuth error: {e}")
         return None
 
-async def search_ebay(query, max_items=10):
+async def search_ebay(query, max_items=10, use_cache=True):
     """Search eBay for items"""
+    # Serve from the on-disk cache when possible (survives restarts)
+    cache_key = make_key(EBAY_ENVIRONMENT, max_items, query)
+    cached = await asyncio.to_thread(get_cached, cache_key) if use_cache else None
+    if cached is not None:
+        logger.info(f"💾 Cache hit for '{query}'")
+        return cached
+    
+    # Space out real API calls
+    global last_search_at
+    async with search_throttle:
+        wait = last_search_at + EBAY_SEARCH_INTERVAL - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        last_search_at = time.monotonic()
+    
     token = await get_oauth_token()
     if not token:
         return []
@@ -116,7 +148,9 @@ async def search_ebay(query, max_items=10):
             async with session.get(EBAY_BROWSE_URL, headers=headers, params=params, timeout=15) as response:
                 if response.status == 200:
                     data = await response.json()
-                    return parse_search_results(data)
+                    items = parse_search_results(data)
+                    await asyncio.to_thread(set_cached, cache_key, items)
+                    return items
                 else:
                     error_text = await response.text()
                     logger.error(f"❌ Search failed ({response.status}): {error_text[:200]}")
@@ -202,6 +236,47 @@ def filter_by_condition(items, condition_type):
     
     return filtered[:5]  # Return top 5
 
+def build_status_embed():
+    """Build the static !test status embed"""
+    return discord.Embed(
+        title="🎴 Bot Status",
+        description=f"✅ Bot is online!\n📍 Environment: **{EBAY_ENVIRONMENT}**",
+        color=0x00ff00
+    )
+
+def build_info_embed():
+    """Build the static !info help embed"""
+    embed = discord.Embed(
+        title="🎴 Pokemon Card Price Bot",
+        description="Get current Pokemon card prices from eBay",
+        color=0x0099ff
+    )
+    
+    embed.add_field(
+        name="📋 Commands",
+        value="`!price <card name>` - Check card prices\n`!trend <card name>` - Show price trends\n`!test` - Test bot status\n`!debug` - Show debug info\n`!info` - Show this help",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="💡 Usage Tips",
+        value="• Use simple card names (e.g. 'Charizard Base Set')\n• Bot shows Raw, PSA 9, and PSA 10 prices\n• 🔨 = Auction, 💰 = Buy It Now",
+        inline=False
+    )
+    
+    if EBAY_ENVIRONMENT == "SANDBOX":
+        embed.add_field(
+            name="🧪 Sandbox Mode",
+            value="Currently running with test data only",
+            inline=False
+        )
+    
+    return embed
+
+# Static embeds are built once and cloned per message
+STATUS_TEMPLATE = EmbedTemplate(build_status_embed())
+INFO_TEMPLATE = EmbedTemplate(build_info_embed())
+
 @bot.event
 async def on_ready():
     print(f'✅ {bot.user} is online!')
@@ -217,12 +292,7 @@ async def on_ready():
 @bot.command(name='test')
 async def test_command(ctx):
     """Simple test command"""
-    embed = discord.Embed(
-        title="🎴 Bot Status",
-        description=f"✅ Bot is online!\n📍 Environment: **{EBAY_ENVIRONMENT}**",
-        color=0x00ff00
-    )
-    await ctx.send(embed=embed)
+    await ctx.send(embed=STATUS_TEMPLATE.render())
 
 @bot.command(name='price')
 async def price_command(ctx, *, card_name):
@@ -240,6 +310,15 @@ async def price_command(ctx, *, card_name):
     
     card_name = card_name.strip()
     
+    # Resolve typos and variants to a canonical catalog card
+    search_name = card_name
+    card_key = None  # Trends are only tracked for catalog cards
+    card = resolve_card(card_name)
+    if card:
+        card_name = card['display_name']
+        search_name = card['query']
+        card_key = card['cache_key']
+    
     # Initial searching message
     embed = discord.Embed(
         description=f"🔍 Searching for **{card_name}**...",
@@ -250,9 +329,9 @@ async def price_command(ctx, *, card_name):
     try:
         # Search for different conditions
         conditions = {
-            'raw': f'{card_name} -psa -cgc -bgs -graded',
-            'psa_9': f'{card_name} psa 9',
-            'psa_10': f'{card_name} psa 10'
+            'raw': f'{search_name} -psa -cgc -bgs -graded',
+            'psa_9': f'{search_name} psa 9',
+            'psa_10': f'{search_name} psa 10'
         }
         
         all_results = {}
@@ -261,7 +340,6 @@ async def price_command(ctx, *, card_name):
             items = await search_ebay(query, 15)
             filtered = filter_by_condition(items, condition.replace('_', ' ').replace('psa ', 'psa '))
             all_results[condition] = filtered
-            await asyncio.sleep(1)  # Rate limiting
         
         # Create results embed
         embed = discord.Embed(
@@ -336,6 +414,20 @@ async def price_command(ctx, *, card_name):
                     inline=False
                 )
         else:
+            # Update rolling trends and flag notable moves
+            movements = []
+            for condition, items in all_results.items():
+                if items and card_key:
+                    snapshot = await asyncio.to_thread(
+                        record_price, card_key, condition, mean(item['price'] for item in items)
+                    )
+                    move = describe_price_move(snapshot) if snapshot else None
+                    if move:
+                        movements.append(f"**{CONDITION_LABELS[condition]}**: {move}")
+            
+            if movements:
+                embed.add_field(name="🚨 Price Movement", value="\n".join(movements), inline=False)
+            
             # Add some individual listings
             embed.add_field(name="\u200b", value="**Recent Listings:**", inline=False)
             
@@ -382,6 +474,52 @@ async def price_command(ctx, *, card_name):
         )
         await message.edit(embed=error_embed)
 
+@bot.command(name='trend')
+async def trend_command(ctx, *, card_name):
+    """Show rolling price trends for a card"""
+    card = resolve_card(card_name)
+    display_name = card['display_name'] if card else card_name.strip().title()
+    
+    embed = discord.Embed(
+        title=f"📈 {display_name}",
+        description="**Price Trends**",
+        color=0x9b59b6,
+        timestamp=datetime.now(timezone.utc)
+    )
+    
+    if not card:
+        embed.description = "❌ Trends are tracked per card. Include the set or number, e.g. `!trend charizard base set`."
+        embed.color = 0xff0000
+        await ctx.send(embed=embed)
+        return
+    
+    trend = await asyncio.to_thread(get_trend, card['cache_key'])
+    if not trend:
+        embed.description = f"❌ No price history yet. Run `!price {card_name.strip()}` first."
+        embed.color = 0xff0000
+        await ctx.send(embed=embed)
+        return
+    
+    for condition, label in CONDITION_LABELS.items():
+        snapshot = trend.get(condition)
+        if not snapshot:
+            continue
+        
+        lines = [
+            f"**${snapshot['price']:.2f}** latest",
+            f"${snapshot['ewma']:.2f} EWMA",
+            f"{format_span(snapshot['span_7d'])}: {snapshot['delta_7d']:+.1f}% • "
+            f"{format_span(snapshot['span_30d'])}: {snapshot['delta_30d']:+.1f}%"
+        ]
+        if snapshot['z_score'] is not None:
+            lines.append(f"z-score: {snapshot['z_score']:+.2f}")
+        lines.append(f"*{snapshot['observations']} observations*")
+        
+        embed.add_field(name=label, value="\n".join(lines), inline=True)
+    
+    embed.set_footer(text="Trends update on !price checks")
+    await ctx.send(embed=embed)
+
 @bot.command(name='debug')
 async def debug_command(ctx):
     """Show bot debug information"""
@@ -414,7 +552,7 @@ async def debug_command(ctx):
     
     # Test search
     try:
-        test_items = await search_ebay("pokemon charizard", 3)
+        test_items = await search_ebay("pokemon charizard", 3, use_cache=False)
         search_status = f"✅ **Working** ({len(test_items)} items found)"
     except Exception as e:
         search_status = f"❌ **Error**: {str(e)[:100]}"
@@ -425,38 +563,21 @@ async def debug_command(ctx):
         inline=False
     )
     
-    await ctx.send(embed=embed)
-
-@bot.command(name='info')
-async def info_command(ctx):
-    """Show help information"""
-    embed = discord.Embed(
-        title="🎴 Pokemon Card Price Bot",
-        description="Get current Pokemon card prices from eBay",
-        color=0x0099ff
-    )
-    
-    embed.add_field(
-        name="📋 Commands",
-        value="`!price <card name>` - Check card prices\n`!test` - Test bot status\n`!debug` - Show debug info\n`!info` - Show this help",
-        inline=False
-    )
-    
+    # Cache info
+    live_entries, total_entries = await asyncio.to_thread(cache_stats)
     embed.add_field(
-        name="💡 Usage Tips",
-        value="• Use simple card names (e.g. 'Charizard Base Set')\n• Bot shows Raw, PSA 9, and PSA 10 prices\n• 🔨 = Auction, 💰 = Buy It Now",
+        name="💾 Response Cache",
+        value=f"**{live_entries}** live / {total_entries} stored entries",
         inline=False
     )
     
-    if EBAY_ENVIRONMENT == "SANDBOX":
-        embed.add_field(
-            name="🧪 Sandbox Mode",
-            value="Currently running with test data only",
-            inline=False
-        )
-    
     await ctx.send(embed=embed)
 
+@bot.command(name='info')
+async def info_command(ctx):
+    """Show help information"""
+    await ctx.send(embed=INFO_TEMPLATE.render())
+
 # Error handling
 @price_command.error
 async def price_error(ctx, error):
@@ -466,6 +587,14 @@ async def price_error(ctx, error):
         logger.error(f"Price command error: {error}")
         await ctx.send("❌ An error occurred. Please try again.")
 
+@trend_command.error
+async def trend_error(ctx, error):
+    if isinstance(error, commands.MissingRequiredArgument):
+        await ctx.send("❌ Please provide a card name! Example: `!trend charizard`")
+    else:
+        logger.error(f"Trend command error: {error}")
+        await ctx.send("❌ An error occurred. Please try again.")
+
 if __name__ == "__main__":
     try:
         print("🚀 Starting Pokemon Card Price Bot...")
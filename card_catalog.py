@@ -0,0 +1,185 @@
+import re
+from collections import defaultdict
+from functools import lru_cache
+
+# Local card catalog used to resolve free-text !price queries that name a set or number
+# Extend this list (or the set aliases) as more cards are tracked
+SET_ALIASES = {
+    "Base Set": ["base", "base set", "bs"],
+    "Jungle": ["jungle"],
+    "Fossil": ["fossil"],
+    "Base Set 2": ["base 2", "base set 2", "b2"],
+    "Team Rocket": ["team rocket", "rocket", "tr"],
+}
+
+CARD_CATALOG = [
+    {"set": "Base Set", "number": "2/102", "name": "Blastoise", "aliases": ["blastoise holo", "toise"]},
+    {"set": "Base Set", "number": "4/102", "name": "Charizard", "aliases": ["charizard holo", "zard", "char"]},
+    {"set": "Base Set", "number": "10/102", "name": "Mewtwo", "aliases": ["mewtwo holo"]},
+    {"set": "Base Set", "number": "15/102", "name": "Venusaur", "aliases": ["venusaur holo", "saur"]},
+    {"set": "Base Set", "number": "58/102", "name": "Pikachu", "aliases": ["red cheeks pikachu", "pika"]},
+    {"set": "Jungle", "number": "12/64", "name": "Snorlax", "aliases": ["snorlax holo"]},
+    {"set": "Fossil", "number": "15/62", "name": "Zapdos", "aliases": ["zapdos holo"]},
+    {"set": "Fossil", "number": "5/62", "name": "Gengar", "aliases": ["gengar holo"]},
+    {"set": "Base Set 2", "number": "4/130", "name": "Charizard", "aliases": ["charizard holo", "zard", "char"]},
+    {"set": "Team Rocket", "number": "4/82", "name": "Dark Charizard", "aliases": ["dark zard"]},
+]
+
+# Minimum Dice similarity for a match to be accepted
+MIN_MATCH_SCORE = 0.7
+
+# Best card must beat the runner-up card by this much, otherwise the input is ambiguous
+MIN_SCORE_GAP = 0.1
+
+# Words at least this long may match with a single typo
+MIN_FUZZY_WORD_LENGTH = 5
+
+_NORMALIZE_RE = re.compile(r"[^a-z0-9/ ]+")
+
+
+def normalize_text(text):
+    """Lowercase, strip punctuation and collapse whitespace"""
+    text = _NORMALIZE_RE.sub(" ", text.lower())
+    return " ".join(text.split())
+
+
+def trigrams(text):
+    """Return the set of word-padded character trigrams for text"""
+    grams = set()
+    for word in normalize_text(text).split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+
+def _card_documents(card):
+    """Yield every searchable phrasing of a catalog card.
+
+    Every phrasing names the set or the card number; a bare name like "pikachu"
+    covers many real printings, so it is left to a broad eBay search.
+    """
+    set_names = [card["set"]] + SET_ALIASES.get(card["set"], [])
+    for variant in [card["name"]] + card.get("aliases", []):
+        yield f"{variant} {card['number']}"
+        for set_name in set_names:
+            yield f"{variant} {set_name}"
+            yield f"{variant} {set_name} {card['number']}"
+
+
+def _build_index(catalog):
+    """Build the trigram -> document inverted index"""
+    documents = []  # (card index, trigram count, words)
+    index = defaultdict(list)
+
+    for card_idx, card in enumerate(catalog):
+        seen = set()
+        for text in _card_documents(card):
+            grams = frozenset(trigrams(text))
+            if not grams or grams in seen:
+                continue
+            seen.add(grams)
+            doc_id = len(documents)
+            documents.append((card_idx, len(grams), tuple(normalize_text(text).split())))
+            for gram in grams:
+                index[gram].append(doc_id)
+
+    return documents, dict(index)
+
+
+_documents, _index = _build_index(CARD_CATALOG)
+
+
+def canonical_card(card):
+    """Return the canonical form of a catalog card"""
+    name = f"{card['name']} {card['set']} {card['number']}"
+    return {
+        "name": card["name"],
+        "set": card["set"],
+        "number": card["number"],
+        "display_name": name,
+        "query": f"{card['name']} {card['number']} {card['set']}",
+        "cache_key": normalize_text(f"{card['set']} {card['number']}").replace(" ", "-").replace("/", "-"),
+    }
+
+
+def _within_one_edit(a, b):
+    """True if a and b differ by at most one insertion, deletion or substitution"""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    for i in range(len(a)):
+        if a[i] != b[i]:
+            # Substitution if equal length, otherwise b has an extra character here
+            return a[i + 1:] == b[i + 1:] if len(a) == len(b) else a[i:] == b[i + 1:]
+    return True
+
+
+def _words_cover(query_words, doc_words):
+    """True if every query word matches a distinct whole document word and vice versa.
+
+    Words match exactly, or with one typo when both are long alphabetic words,
+    so "mew" never matches "mewtwo" and extra words like "vmax" are rejected.
+    """
+    if len(query_words) != len(doc_words):
+        return False
+
+    remaining = list(doc_words)
+    fuzzy = []
+    for word in query_words:
+        if word in remaining:
+            remaining.remove(word)
+        else:
+            fuzzy.append(word)
+
+    for word in fuzzy:
+        for candidate in remaining:
+            if (len(word) >= MIN_FUZZY_WORD_LENGTH and word.isalpha() and candidate.isalpha()
+                    and _within_one_edit(word, candidate)):
+                remaining.remove(candidate)
+                break
+        else:
+            return False
+
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _best_match(normalized):
+    """Return the catalog index uniquely matching a normalized query, or None"""
+    query_grams = trigrams(normalized)
+    if not query_grams:
+        return None
+    query_words = normalized.split()
+
+    shared = defaultdict(int)
+    for gram in query_grams:
+        for doc_id in _index.get(gram, ()):
+            shared[doc_id] += 1
+
+    # Best covered score per card
+    card_scores = {}
+    for doc_id, count in shared.items():
+        card_idx, doc_size, doc_words = _documents[doc_id]
+        score = 2 * count / (len(query_grams) + doc_size)
+        if score < MIN_MATCH_SCORE or score <= card_scores.get(card_idx, 0.0):
+            continue
+        if _words_cover(query_words, doc_words):
+            card_scores[card_idx] = score
+
+    if not card_scores:
+        return None
+
+    ranked = sorted(card_scores.items(), key=lambda item: item[1], reverse=True)
+    if len(ranked) > 1 and ranked[0][1] - ranked[1][1] < MIN_SCORE_GAP:
+        return None  # e.g. bare "charizard" names more than one card
+    return ranked[0][0]
+
+
+def resolve_card(card_name):
+    """Resolve free-text input to a canonical catalog card, or None if no confident match"""
+    card_idx = _best_match(normalize_text(card_name))
+    if card_idx is None:
+        return None
+    return canonical_card(CARD_CATALOG[card_idx])
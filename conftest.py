@@ -0,0 +1,14 @@
+import threading
+
+import pytest
+
+import response_cache
+
+
+@pytest.fixture
+def cache_db(tmp_path, monkeypatch):
+    """Point the shared SQLite file at a temp path with fresh connections"""
+    path = tmp_path / "cache.sqlite3"
+    monkeypatch.setattr(response_cache, "CACHE_PATH", str(path))
+    monkeypatch.setattr(response_cache, "_local", threading.local())
+    return path
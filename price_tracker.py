@@ -1,5 +1,6 @@
 from tcgplayer import get_raw_price
 from ebay_scraper import get_graded_price
+from price_trends import record_price, describe_price_move, trend_key
 
 # Example list of cards to track
 cards_to_track = [
@@ -7,19 +8,43 @@ cards_to_track = [
     {"name": "Blastoise Base Set", "grading_cost": 20, "profit_threshold": 40},
 ]
 
-def check_card_prices():
+def evaluate_card(card, budget=None):
+    """Fetch prices for one card and return its alerts.
+
+    ``budget`` is an optional shared eBay rate budget; one token is taken
+    for the eBay lookup (TCGPlayer prices don't count against it).
+    """
     alerts = []
-    for card in cards_to_track:
-        raw_price = get_raw_price(card["name"])
-        graded_price = get_graded_price(card["name"])
-        profit = graded_price - raw_price - card["grading_cost"]
-        
-        if profit >= card["profit_threshold"]:
-            alert = (
+    
+    raw_price = get_raw_price(card["name"])
+    if budget:
+        budget.acquire()
+    graded_price = get_graded_price(card["name"])
+    
+    # Update rolling trends and flag notable moves
+    card_key = trend_key(card["name"])
+    for condition, price in (("raw", raw_price), ("psa_10", graded_price)):
+        if price <= 0 or not card_key:
+            continue
+        snapshot = record_price(card_key, condition, price)
+        move = describe_price_move(snapshot) if snapshot else None
+        if move:
+            alerts.append(f"🚨 Price Alert: **{card['name']}** ({condition.replace('_', ' ').upper()})\n{move}")
+    
+    profit = graded_price - raw_price - card["grading_cost"]
+    
+    if profit >= card["profit_threshold"]:
+        alert = (
     f"🔥 Buy Alert: **{card['name']}**\n"
     f"Raw Price: ${raw_price:.2f}\n"
     f"Graded (PSA 10): ${graded_price:.2f}\n"
     f"Estimated Profit: ${profit:.2f} 💰"
 )
-            alerts.append(alert)
-    return alerts
\ No newline at end of file
+        alerts.append(alert)
+    return alerts
+
+def check_card_prices():
+    alerts = []
+    for card in cards_to_track:
+        alerts.extend(evaluate_card(card))
+    return alerts
@@ -0,0 +1,199 @@
+import math
+from datetime import datetime, timezone, timedelta
+
+from card_catalog import resolve_card
+from response_cache import CACHE_TTL_SECONDS, get_connection
+
+# EWMA smoothing factor (higher = reacts faster to new prices)
+EWMA_ALPHA = 0.2
+
+# Alert when the 7-day window move exceeds this percentage
+MOVE_ALERT_PCT = 10.0
+
+# Alert when a new price is this many standard deviations from the EWMA
+SPIKE_Z_SCORE = 3.0
+
+# Observations needed before z-scores are trusted
+MIN_OBSERVATIONS = 5
+
+# Observations closer together than this are dropped; repeated !price calls
+# inside the cache TTL return the same listings and would shrink the variance
+MIN_OBSERVATION_INTERVAL = timedelta(seconds=CACHE_TTL_SECONDS)
+
+WINDOWS = {
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+}
+
+# Rolling state lives in the response cache's SQLite file, so it survives
+# restarts and is shared by the bot, price_tracker and every shard worker
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS price_stats ("
+    " card_key TEXT NOT NULL,"
+    " condition TEXT NOT NULL,"
+    " count INTEGER NOT NULL,"
+    " ewma REAL NOT NULL,"
+    " ewvar REAL NOT NULL,"
+    " price REAL NOT NULL,"
+    " delta_7d REAL NOT NULL,"
+    " delta_30d REAL NOT NULL,"
+    " span_7d REAL NOT NULL,"
+    " span_30d REAL NOT NULL,"
+    " z_score REAL,"
+    " observed_at REAL NOT NULL,"
+    " PRIMARY KEY (card_key, condition))",
+    "CREATE TABLE IF NOT EXISTS price_observations ("
+    " card_key TEXT NOT NULL,"
+    " condition TEXT NOT NULL,"
+    " observed_at REAL NOT NULL,"
+    " price REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS price_observations_window"
+    " ON price_observations (card_key, condition, observed_at)",
+)
+
+
+def _connection():
+    """Shared SQLite connection with the trend tables in place"""
+    conn = get_connection()
+    for statement in _SCHEMA:
+        conn.execute(statement)
+    return conn
+
+
+def update_ewma(count, ewma, ewvar, price, alpha=EWMA_ALPHA):
+    """Fold one price into the EWMA/EW variance; returns (ewma, ewvar, z_score)"""
+    # Score against the state before this observation
+    z_score = None
+    if count >= MIN_OBSERVATIONS and ewvar > 0:
+        z_score = (price - ewma) / math.sqrt(ewvar)
+
+    if count == 0:
+        return price, 0.0, z_score
+
+    diff = price - ewma
+    incr = alpha * diff
+    return ewma + incr, (1 - alpha) * (ewvar + diff * incr), z_score
+
+
+def _snapshot(row):
+    """Convert a price_stats row into a snapshot dict"""
+    count, ewma, _, price, delta_7d, delta_30d, span_7d, span_30d, z_score, observed_at = row
+    return {
+        "price": price,
+        "ewma": ewma,
+        "delta_7d": delta_7d,
+        "delta_30d": delta_30d,
+        "span_7d": timedelta(seconds=span_7d),
+        "span_30d": timedelta(seconds=span_30d),
+        "z_score": z_score,
+        "observations": count,
+        "observed_at": datetime.fromtimestamp(observed_at, timezone.utc),
+    }
+
+
+def trend_key(card_name):
+    """Stable key for a catalog card, or None if the input doesn't resolve to one.
+
+    Only catalog cards are tracked, so free-text input can't grow the tables.
+    """
+    card = resolve_card(card_name)
+    return card["cache_key"] if card else None
+
+
+def record_price(card_key, condition, price, observed_at=None):
+    """Record a price for a card/condition and return the updated snapshot (None if skipped).
+
+    Each observation is a handful of indexed statements, independent of history
+    length. Blocking; call it via asyncio.to_thread from the event loop.
+    """
+    observed_at = (observed_at or datetime.now(timezone.utc)).timestamp()
+    conn = _connection()
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(
+            "SELECT count, ewma, ewvar, observed_at FROM price_stats WHERE card_key = ? AND condition = ?",
+            (card_key, condition)
+        ).fetchone()
+        count, ewma, ewvar, last_seen = row if row else (0, 0.0, 0.0, None)
+
+        if last_seen is not None and observed_at - last_seen < MIN_OBSERVATION_INTERVAL.total_seconds():
+            conn.execute("ROLLBACK")
+            return None
+
+        ewma, ewvar, z_score = update_ewma(count, ewma, ewvar, price)
+
+        # Keep only the longest window; each observation is inserted and evicted once
+        conn.execute(
+            "INSERT INTO price_observations (card_key, condition, observed_at, price) VALUES (?, ?, ?, ?)",
+            (card_key, condition, observed_at, price)
+        )
+        conn.execute(
+            "DELETE FROM price_observations WHERE card_key = ? AND condition = ? AND observed_at < ?",
+            (card_key, condition, observed_at - max(WINDOWS.values()).total_seconds())
+        )
+
+        deltas = {}
+        spans = {}
+        for name, window in WINDOWS.items():
+            oldest_at, oldest_price = conn.execute(
+                "SELECT observed_at, price FROM price_observations"
+                " WHERE card_key = ? AND condition = ? AND observed_at >= ?"
+                " ORDER BY observed_at LIMIT 1",
+                (card_key, condition, observed_at - window.total_seconds())
+            ).fetchone()
+            # History may be younger than the window, so record the span actually covered
+            spans[name] = observed_at - oldest_at
+            deltas[name] = (price - oldest_price) / oldest_price * 100 if oldest_price else 0.0
+
+        stats = (
+            count + 1, ewma, ewvar, price,
+            deltas["7d"], deltas["30d"], spans["7d"], spans["30d"],
+            z_score, observed_at,
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO price_stats (card_key, condition, count, ewma, ewvar, price,"
+            " delta_7d, delta_30d, span_7d, span_30d, z_score, observed_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (card_key, condition) + stats
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    return _snapshot(stats)
+
+
+def get_trend(card_key):
+    """Return the latest snapshot per condition for a card (empty if never seen)"""
+    rows = _connection().execute(
+        "SELECT condition, count, ewma, ewvar, price, delta_7d, delta_30d, span_7d, span_30d,"
+        " z_score, observed_at FROM price_stats WHERE card_key = ?",
+        (card_key,)
+    ).fetchall()
+    return {row[0]: _snapshot(row[1:]) for row in rows}
+
+
+def format_span(span):
+    """Short label for the time a delta actually covers, e.g. '3d' or '5h'"""
+    if span.days:
+        return f"{span.days}d"
+    hours = span.seconds // 3600
+    if hours:
+        return f"{hours}h"
+    return f"{span.seconds // 60}m"
+
+
+def describe_price_move(snapshot):
+    """Return a short alert string if the snapshot shows a notable move, else None"""
+    z_score = snapshot["z_score"]
+    if z_score is not None and abs(z_score) >= SPIKE_Z_SCORE:
+        direction = "spiked" if z_score > 0 else "dropped"
+        return f"Price {direction} to ${snapshot['price']:.2f} ({z_score:+.1f}σ vs ${snapshot['ewma']:.2f} avg)"
+
+    if abs(snapshot["delta_7d"]) >= MOVE_ALERT_PCT:
+        arrow = "📈" if snapshot["delta_7d"] > 0 else "📉"
+        return f"{arrow} Price moved {snapshot['delta_7d']:+.1f}% over {format_span(snapshot['span_7d'])} (now ${snapshot['price']:.2f})"
+
+    return None
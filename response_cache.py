@@ -0,0 +1,144 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# On-disk cache for eBay search results, shared by every bot process
+CACHE_PATH = os.getenv("EBAY_CACHE_PATH", "ebay_cache.sqlite3")
+CACHE_TTL_SECONDS = int(os.getenv("EBAY_CACHE_TTL", 900))
+CACHE_MAX_ENTRIES = int(os.getenv("EBAY_CACHE_MAX_ENTRIES", 5000))
+
+# How long a write waits for another process's lock
+BUSY_TIMEOUT_SECONDS = 5
+
+# Reads only refresh accessed_at (the LRU order) when it is older than this
+ACCESS_TOUCH_SECONDS = 60
+
+# Expired and over-limit entries are pruned once every this many writes per process,
+# so the table can briefly exceed CACHE_MAX_ENTRIES
+PRUNE_EVERY_WRITES = 100
+
+# Connections are opened lazily, one per thread and process
+# (sqlite connections must not cross threads or a fork)
+_local = threading.local()
+_writes_lock = threading.Lock()
+_writes_since_prune = PRUNE_EVERY_WRITES  # Prune on the first write after startup
+
+
+def get_connection():
+    """Open (or reuse) this thread's connection to the shared SQLite database"""
+    connection = getattr(_local, "connection", None)
+    if connection is not None and _local.pid == os.getpid():
+        return connection
+
+    connection = sqlite3.connect(CACHE_PATH, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")  # Readers don't block the writer
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        " key TEXT PRIMARY KEY,"
+        " value TEXT NOT NULL,"
+        " expires_at REAL NOT NULL,"
+        " accessed_at REAL NOT NULL)"
+    )
+    connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+    _local.connection = connection
+    _local.pid = os.getpid()
+    logger.info(f"💾 Response cache opened at {CACHE_PATH}")
+    return connection
+
+
+def make_key(*parts):
+    """Build a cache key from query parts (case and whitespace insensitive)"""
+    return "|".join(" ".join(str(part).lower().split()) for part in parts)
+
+
+def get_cached(key):
+    """Return the cached value for key, or None if missing or expired.
+
+    Blocking; call it via asyncio.to_thread from the event loop.
+    """
+    try:
+        conn = get_connection()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, accessed_at FROM responses WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, accessed_at = row
+        if now - accessed_at > ACCESS_TOUCH_SECONDS:
+            _touch(conn, key, now)
+        return json.loads(value)
+
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning(f"⚠️ Cache read failed: {e}")
+        return None
+
+
+def _touch(conn, key, now):
+    """Best-effort LRU refresh; skipped if another process holds the write lock"""
+    try:
+        conn.execute("PRAGMA busy_timeout = 0")
+        conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+    except sqlite3.OperationalError:
+        pass
+    finally:
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_SECONDS * 1000}")
+
+
+def _due_for_prune():
+    """Count a write and report whether this one should prune"""
+    global _writes_since_prune
+    with _writes_lock:
+        _writes_since_prune += 1
+        if _writes_since_prune < PRUNE_EVERY_WRITES:
+            return False
+        _writes_since_prune = 0
+        return True
+
+
+def set_cached(key, value, ttl=CACHE_TTL_SECONDS):
+    """Store a JSON-serializable value, periodically evicting expired and least recently used entries.
+
+    Blocking; call it via asyncio.to_thread from the event loop.
+    """
+    try:
+        conn = get_connection()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), now + ttl, now)
+        )
+
+        if not _due_for_prune():
+            return
+
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        overflow = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - CACHE_MAX_ENTRIES
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
+
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        logger.warning(f"⚠️ Cache write failed: {e}")
+
+
+def cache_stats():
+    """Return (live entries, total entries) for debugging"""
+    try:
+        conn = get_connection()
+        live = conn.execute("SELECT COUNT(*) FROM responses WHERE expires_at > ?", (time.time(),)).fetchone()[0]
+        total = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return live, total
+    except sqlite3.Error as e:
+        logger.warning(f"⚠️ Cache stats failed: {e}")
+        return 0, 0
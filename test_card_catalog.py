@@ -0,0 +1,46 @@
+import pytest
+
+from card_catalog import resolve_card
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("zard base", "Charizard Base Set 4/102"),
+    ("charizard 4/102", "Charizard Base Set 4/102"),
+    ("Charizard Holo Base Set", "Charizard Base Set 4/102"),
+    ("charzard base set", "Charizard Base Set 4/102"),
+    ("charizard base set 2", "Charizard Base Set 2 4/130"),
+    ("dark zard rocket", "Dark Charizard Team Rocket 4/82"),
+    ("blastoise 2/102", "Blastoise Base Set 2/102"),
+])
+def test_resolves_known_cards(query, expected):
+    assert resolve_card(query)["display_name"] == expected
+
+
+@pytest.mark.parametrize("query", [
+    "charizard vmax",
+    "charizard ex 151",
+    "charizard upc",
+    "pikachu illustrator",
+    "mew",
+    "gengar vmax",
+    "base set booster box",
+    "random junk xyz",
+])
+def test_leftover_words_do_not_resolve(query):
+    assert resolve_card(query) is None
+
+
+@pytest.mark.parametrize("query", [
+    "charizard",
+    "char",
+    "zard",
+    "charizard holo",
+    "dark zard",
+    "blastoise",
+    "pikachu",
+    "mewtwo",
+    "gengar",
+    "venusaur",
+])
+def test_name_only_queries_do_not_resolve(query):
+    assert resolve_card(query) is None
@@ -0,0 +1,54 @@
+import pytest
+
+discord = pytest.importorskip("discord")
+
+from utilsmessage_formatting import EmbedTemplate, generate_card_alert_embed
+
+
+def build_embed():
+    embed = discord.Embed(title="Title", description="Description", color=0x3498db)
+    embed.add_field(name="Static", value="Field", inline=False)
+    embed.set_footer(text="Footer", icon_url="https://example.com/icon.png")
+    embed.set_thumbnail(url="https://example.com/thumb.png")
+    embed.set_author(name="Author")
+    return embed
+
+
+def test_render_matches_original_embed():
+    embed = build_embed()
+    assert EmbedTemplate(embed).render().to_dict() == embed.to_dict()
+
+
+def test_rendered_embeds_do_not_share_state():
+    template = EmbedTemplate(build_embed())
+    first = template.render()
+    first.set_footer(text="Changed")
+    first.set_thumbnail(url="https://example.com/other.png")
+    first.add_field(name="Extra", value="Field")
+
+    second = template.render()
+    assert second.footer.text == "Footer"
+    assert second.thumbnail.url == "https://example.com/thumb.png"
+    assert len(second.fields) == 1
+
+
+def test_card_alert_embed_fields():
+    embed = generate_card_alert_embed("Charizard", 100, 350, 230, "https://example.com/logo.png")
+    assert [field.value for field in embed.fields] == ["$100.00", "$350.00", "$230.00"]
+
+    embed.set_footer(text="Changed")
+    again = generate_card_alert_embed("Blastoise", 80, 200, 100, "https://example.com/logo.png")
+    assert again.footer.text == "PokePriceTrackerBot — Smarter Investing in Pokémon"
+
+
+def test_falls_back_to_copy_when_slot_copy_mismatches(monkeypatch, caplog):
+    monkeypatch.setattr(EmbedTemplate, "_copy_slots", lambda self, values=(): discord.Embed())
+    embed = build_embed()
+
+    template = EmbedTemplate(embed, value_fields=[("Dynamic", True)])
+    assert "falling back to Embed.from_dict()" in caplog.text
+
+    rendered = template.render("Value", description="New")
+    assert rendered.description == "New"
+    assert [field.name for field in rendered.fields] == ["Static", "Dynamic"]
+    assert len(template.render().fields) == 1
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from price_trends import (
+    MIN_OBSERVATION_INTERVAL,
+    describe_price_move,
+    get_trend,
+    record_price,
+    trend_key,
+    update_ewma,
+)
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def record_series(prices, step=timedelta(hours=1), key="base-set-4-102", condition="raw"):
+    snapshots = [record_price(key, condition, price, START + step * i) for i, price in enumerate(prices)]
+    return snapshots[-1]
+
+
+def test_ewma_and_variance_update():
+    ewma, ewvar, z_score = update_ewma(0, 0.0, 0.0, 100.0)
+    assert (ewma, ewvar, z_score) == (100.0, 0.0, None)
+
+    ewma, ewvar, z_score = update_ewma(1, 100.0, 0.0, 110.0, alpha=0.2)
+    assert ewma == pytest.approx(102.0)
+    assert ewvar == pytest.approx(0.8 * (0 + 10 * 2))
+    assert z_score is None
+
+
+def test_z_score_needs_min_observations(cache_db):
+    snapshot = record_series([100, 104, 97, 101, 103, 150])
+    assert snapshot["observations"] == 6
+    assert snapshot["z_score"] > 3
+    assert describe_price_move(snapshot).startswith("Price spiked to $150.00")
+
+
+def test_observations_inside_interval_are_dropped(cache_db):
+    record_series([100, 104, 97, 101, 103])
+    last = START + timedelta(hours=4)
+    for i in range(1, 20):
+        assert record_price("base-set-4-102", "raw", 101, last + timedelta(seconds=30 * i)) is None
+
+    snapshot = record_price("base-set-4-102", "raw", 102, last + MIN_OBSERVATION_INTERVAL)
+    assert snapshot["observations"] == 6
+    assert abs(snapshot["z_score"]) < 1
+    assert describe_price_move(snapshot) is None
+
+
+def test_window_eviction_and_deltas(cache_db):
+    record_price("base-set-4-102", "raw", 100, START)
+    record_price("base-set-4-102", "raw", 110, START + timedelta(days=10))
+    snapshot = record_price("base-set-4-102", "raw", 121, START + timedelta(days=12))
+
+    # 7d window starts at the day-10 price, 30d window still holds day 0
+    assert snapshot["delta_7d"] == pytest.approx(10.0)
+    assert snapshot["span_7d"] == timedelta(days=2)
+    assert snapshot["delta_30d"] == pytest.approx(21.0)
+    assert snapshot["span_30d"] == timedelta(days=12)
+
+    snapshot = record_price("base-set-4-102", "raw", 121, START + timedelta(days=41))
+    assert snapshot["span_30d"] == timedelta(days=29)
+    assert snapshot["delta_30d"] == pytest.approx(0.0)
+
+
+def test_move_alert_threshold(cache_db):
+    snapshot = record_series([100, 109], step=timedelta(days=1))
+    assert describe_price_move(snapshot) is None
+
+    snapshot = record_price("base-set-4-102", "raw", 112, START + timedelta(days=2))
+    assert describe_price_move(snapshot) == "📈 Price moved +12.0% over 2d (now $112.00)"
+
+
+def test_trend_is_persisted(cache_db):
+    record_series([100, 90], step=timedelta(days=1), condition="psa_10")
+    trend = get_trend("base-set-4-102")
+    assert list(trend) == ["psa_10"]
+    assert trend["psa_10"]["price"] == 90
+    assert trend["psa_10"]["observations"] == 2
+
+
+def test_only_catalog_cards_are_tracked():
+    assert trend_key("Charizard Holo Base Set") == "base-set-4-102"
+    assert trend_key("some random listing text") is None
@@ -0,0 +1,63 @@
+import pytest
+
+import response_cache
+from response_cache import cache_stats, get_cached, make_key, set_cached
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(cache_db, monkeypatch):
+    clock = FakeTime()
+    monkeypatch.setattr(response_cache, "time", clock)
+    return clock
+
+
+def test_make_key_ignores_case_and_whitespace():
+    assert make_key("PRODUCTION", 15, "Charizard  PSA 10 ") == make_key("production", 15, "charizard psa 10")
+
+
+def test_round_trip_and_ttl_expiry(clock):
+    set_cached("key", [{"price": 1.5}], ttl=60)
+    assert get_cached("key") == [{"price": 1.5}]
+
+    clock.now += 61
+    assert get_cached("key") is None
+    assert get_cached("missing") is None
+
+
+def test_prunes_least_recently_used(clock, monkeypatch):
+    monkeypatch.setattr(response_cache, "CACHE_MAX_ENTRIES", 3)
+    monkeypatch.setattr(response_cache, "PRUNE_EVERY_WRITES", 1)
+
+    for i in range(3):
+        set_cached(f"key{i}", i)
+        clock.now += 1
+
+    # Reading key0 after the touch threshold makes key1 the least recently used
+    clock.now += response_cache.ACCESS_TOUCH_SECONDS + 1
+    assert get_cached("key0") == 0
+
+    set_cached("key3", 3)
+    assert cache_stats() == (3, 3)
+    assert get_cached("key1") is None
+    assert [get_cached(key) for key in ("key0", "key2", "key3")] == [0, 2, 3]
+
+
+def test_prunes_expired_entries_on_schedule(clock, monkeypatch):
+    monkeypatch.setattr(response_cache, "PRUNE_EVERY_WRITES", 3)
+    monkeypatch.setattr(response_cache, "_writes_since_prune", 0)
+
+    set_cached("old", 1, ttl=10)
+    clock.now += 11
+    set_cached("new", 2)
+    assert cache_stats() == (1, 2)  # Expired row kept until the next prune
+
+    set_cached("newer", 3)
+    assert cache_stats() == (2, 2)
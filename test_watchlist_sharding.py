@@ -0,0 +1,76 @@
+import pytest
+
+import watchlist_sharding
+from watchlist_sharding import ConsistentHashRing, RateBudget, ShardedWatchlist, partition_cards
+
+CARDS = [{"name": f"Card {i}", "grading_cost": 20, "profit_threshold": -100} for i in range(1000)]
+
+
+def shard_of(shards):
+    return {card["name"]: shard_id for shard_id, cards in enumerate(shards) for card in cards}
+
+
+def test_partition_is_stable():
+    assert partition_cards(CARDS, 4) == partition_cards(CARDS, 4)
+    assert sum(len(cards) for cards in partition_cards(CARDS, 4)) == len(CARDS)
+    assert ConsistentHashRing(4).shard_for("Card 7") == ConsistentHashRing(4).shard_for("Card 7")
+
+
+def test_partition_is_balanced():
+    sizes = [len(cards) for cards in partition_cards(CARDS, 4)]
+    assert min(sizes) > len(CARDS) / 4 * 0.7
+
+
+def test_adding_a_shard_moves_few_cards():
+    before = shard_of(partition_cards(CARDS, 4))
+    after = shard_of(partition_cards(CARDS, 5))
+
+    moved = [name for name in before if before[name] != after[name]]
+    # Ideal is 1/5 of the cards, all of them onto the new shard
+    assert len(moved) < len(CARDS) * 0.3
+    assert all(after[name] == 4 for name in moved)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(watchlist_sharding, "time", clock)
+    return clock
+
+
+def test_rate_budget_below_one_call_per_second(clock):
+    budget = RateBudget(rate=0.5)
+    start = clock.now
+    for _ in range(3):
+        budget.acquire()
+    # First call uses the single banked token, then one every 2 seconds
+    assert clock.now - start == pytest.approx(4.0)
+
+
+def test_rate_budget_allows_burst_then_throttles(clock):
+    budget = RateBudget(rate=10)
+    start = clock.now
+    for _ in range(10):
+        budget.acquire()
+    assert clock.now == start
+
+    budget.acquire()
+    assert clock.now - start == pytest.approx(0.1)
+
+
+def test_sharded_check_collects_alerts_from_every_worker():
+    cards = CARDS[:8]
+    with ShardedWatchlist(cards, num_workers=2, calls_per_second=100) as watchlist:
+        alerts = watchlist.check(timeout=30)
+    assert sorted(alert.split("**")[1] for alert in alerts) == sorted(card["name"] for card in cards)
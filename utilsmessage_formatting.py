@@ -1,17 +1,86 @@
 # utils/message_formatting.py
+import copy
+import logging
 import discord
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 
-def generate_card_alert_embed(card_name, raw_price, graded_price, profit, logo_url):
+logger = logging.getLogger(__name__)
+
+class EmbedTemplate:
+    """Pre-built embed whose static parts are cloned cheaply per message.
+
+    Fields already on the embed are static. ``value_fields`` declares
+    (name, inline) pairs whose values are passed to render() per message.
+    """
+
+    def __init__(self, embed, value_fields=()):
+        # Embed.copy() round-trips through to_dict()/from_dict(); copying the
+        # slots directly is several times cheaper
+        self._state = tuple(
+            (slot, getattr(embed, slot))
+            for slot in discord.Embed.__slots__
+            if slot != '_fields' and hasattr(embed, slot)
+        )
+        self._static_fields = tuple(getattr(embed, '_fields', ()))
+        self._value_fields = tuple(value_fields)
+        self._fallback = None
+
+        # A discord.py upgrade may add state the slot copy misses; use the public copy() then
+        if self._copy_slots().to_dict() != embed.to_dict():
+            logger.warning("⚠️ EmbedTemplate slot copy doesn't match discord.Embed; falling back to Embed.from_dict()")
+            self._fallback = embed.to_dict()
+
+    def render(self, *values, description=None, timestamp=None):
+        """Return a new embed with the dynamic parts filled in"""
+        if self._fallback is not None:
+            # Embed.copy() shares the field list and footer dicts, so deep-copy the dict form
+            embed = discord.Embed.from_dict(copy.deepcopy(self._fallback))
+            for (name, inline), value in zip(self._value_fields, values):
+                embed.add_field(name=name, value=value, inline=inline)
+        else:
+            embed = self._copy_slots(values)
+
+        if description is not None:
+            embed.description = description
+        if timestamp is not None:
+            embed.timestamp = timestamp
+        return embed
+
+    def _copy_slots(self, values=()):
+        """Build the embed by copying the template's slots directly"""
+        embed = discord.Embed.__new__(discord.Embed)
+        for slot, value in self._state:
+            # Footer, thumbnail, author, etc. are dicts; copy so messages can't edit the template
+            setattr(embed, slot, dict(value) if isinstance(value, dict) else value)
+
+        fields = [dict(field) for field in self._static_fields]
+        for (name, inline), value in zip(self._value_fields, values):
+            fields.append({'inline': inline, 'name': name, 'value': str(value)})
+        if fields:
+            embed._fields = fields
+        return embed
+
+@lru_cache(maxsize=32)
+def _card_alert_template(logo_url):
+    """Static parts of the buy alert embed, built once per logo"""
     embed = discord.Embed(
         title="🔥 Buy Alert!",
-        description=f"**{card_name}** is showing great potential for grading and resale!",
-        color=discord.Color.orange(),
-        timestamp=datetime.utcnow()
+        color=discord.Color.orange()
     )
-    embed.add_field(name="🪙 Raw Price", value=f"${raw_price:.2f}", inline=True)
-    embed.add_field(name="💎 Graded Price (PSA 10)", value=f"${graded_price:.2f}", inline=True)
-    embed.add_field(name="📈 Estimated Profit", value=f"${profit:.2f}", inline=False)
     embed.set_thumbnail(url=logo_url)
     embed.set_footer(text="PokePriceTrackerBot — Smarter Investing in Pokémon", icon_url=logo_url)
-    return embed
+    return EmbedTemplate(embed, value_fields=[
+        ("🪙 Raw Price", True),
+        ("💎 Graded Price (PSA 10)", True),
+        ("📈 Estimated Profit", False),
+    ])
+
+def generate_card_alert_embed(card_name, raw_price, graded_price, profit, logo_url):
+    return _card_alert_template(logo_url).render(
+        f"${raw_price:.2f}",
+        f"${graded_price:.2f}",
+        f"${profit:.2f}",
+        description=f"**{card_name}** is showing great potential for grading and resale!",
+        timestamp=datetime.now(timezone.utc)
+    )
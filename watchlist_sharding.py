@@ -0,0 +1,196 @@
+import os
+import time
+import queue
+import bisect
+import hashlib
+import multiprocessing
+
+from price_tracker import cards_to_track, evaluate_card
+
+# Global eBay call budget shared by every worker
+EBAY_CALLS_PER_SECOND = float(os.getenv("EBAY_CALLS_PER_SECOND", 5))
+
+# Extra seconds a check may take beyond what the rate budget alone requires
+CHECK_GRACE_SECONDS = 60
+
+# Virtual nodes per shard on the hash ring (smooths the distribution)
+RING_REPLICAS = 100
+
+
+def _stable_hash(key):
+    """Process-independent hash (built-in hash() is salted per process)"""
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+
+class ConsistentHashRing:
+    """Maps card names to shards; resizing only moves ~1/N of the cards"""
+
+    def __init__(self, num_shards, replicas=RING_REPLICAS):
+        points = sorted(
+            (_stable_hash(f"shard-{shard}-{replica}"), shard)
+            for shard in range(num_shards)
+            for replica in range(replicas)
+        )
+        self._hashes = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard_for(self, key):
+        idx = bisect.bisect(self._hashes, _stable_hash(key)) % len(self._hashes)
+        return self._shards[idx]
+
+
+def partition_cards(cards, num_shards):
+    """Split cards into num_shards lists by consistent hash of the card name"""
+    ring = ConsistentHashRing(num_shards)
+    shards = [[] for _ in range(num_shards)]
+    for card in cards:
+        shards[ring.shard_for(card["name"])].append(card)
+    return shards
+
+
+class RateBudget:
+    """Token bucket in shared memory, so all workers draw from one eBay budget"""
+
+    def __init__(self, rate=EBAY_CALLS_PER_SECOND, burst=None, ctx=multiprocessing):
+        self.rate = rate
+        self.capacity = max(1.0, burst or rate)  # Below 1 token acquire() could never succeed
+        self._lock = ctx.Lock()
+        self._tokens = ctx.Value("d", self.capacity, lock=False)
+        self._updated = ctx.Value("d", time.monotonic(), lock=False)
+
+    def acquire(self):
+        """Block until a call is allowed"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens = min(self.capacity, self._tokens.value + (now - self._updated.value) * self.rate)
+                self._updated.value = now
+                if tokens >= 1:
+                    self._tokens.value = tokens - 1
+                    return
+                self._tokens.value = tokens
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+def _shard_worker(shard_id, cards, budget, commands, results):
+    """Worker loop: evaluate this shard's cards each time a check is requested"""
+    while True:
+        check_id = commands.get()
+        if check_id is None:
+            break
+
+        alerts = []
+        for card in cards:
+            try:
+                alerts.extend(evaluate_card(card, budget))
+            except Exception as e:
+                print(f"⚠️ Shard {shard_id} failed on {card['name']}: {e}")
+        results.put((shard_id, check_id, alerts))
+
+
+class ShardedWatchlist:
+    """Runs check_card_prices-style polling across N worker processes.
+
+    Cards are pinned to workers by consistent hash, so per-card state (such as
+    rolling price trends) stays in one process between checks. Workers only
+    return alert text; the calling process does the Discord fan-out. check()
+    blocks, so call it via run_in_executor from the bot's event loop.
+    """
+
+    def __init__(self, cards=None, num_workers=None, calls_per_second=EBAY_CALLS_PER_SECOND):
+        self.cards = cards if cards is not None else cards_to_track
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.calls_per_second = calls_per_second
+        # spawn, not fork: the bot process is multithreaded (event loop, to_thread workers)
+        self._ctx = multiprocessing.get_context("spawn")
+        self._shards = []
+        self._workers = []
+        self._commands = []
+        self._results = None
+        self._budget = None
+        self._check_id = 0
+
+    def _spawn(self, shard_id):
+        """Start (or replace) the worker process for one shard"""
+        commands = self._ctx.Queue()
+        worker = self._ctx.Process(
+            target=_shard_worker,
+            args=(shard_id, self._shards[shard_id], self._budget, commands, self._results),
+            name=f"watchlist-shard-{shard_id}",
+            daemon=True
+        )
+        worker.start()
+        self._workers[shard_id] = worker
+        self._commands[shard_id] = commands
+
+    def start(self):
+        self._budget = RateBudget(self.calls_per_second, ctx=self._ctx)
+        self._results = self._ctx.Queue()
+        self._shards = partition_cards(self.cards, self.num_workers)
+        self._workers = [None] * self.num_workers
+        self._commands = [None] * self.num_workers
+
+        for shard_id in range(self.num_workers):
+            self._spawn(shard_id)
+
+        print(f"✅ Watchlist sharded across {self.num_workers} workers ({len(self.cards)} cards)")
+        return self
+
+    def check(self, timeout=None):
+        """Run one check on every shard and return all alerts, ordered by shard.
+
+        Dead workers are restarted and their shard is skipped for this check.
+        Workers that have not answered by the timeout are replaced the same way.
+        """
+        if timeout is None:
+            # Each card makes one eBay call from the shared budget
+            timeout = len(self.cards) / self.calls_per_second + CHECK_GRACE_SECONDS
+
+        self._check_id += 1
+        for commands in self._commands:
+            commands.put(self._check_id)
+
+        by_shard = {}
+        deadline = time.monotonic() + timeout
+        while len(by_shard) < len(self._workers):
+            try:
+                shard_id, check_id, alerts = self._results.get(timeout=1)
+            except queue.Empty:
+                for shard_id, worker in enumerate(self._workers):
+                    if shard_id not in by_shard and not worker.is_alive():
+                        print(f"⚠️ Shard {shard_id} worker died (exit code {worker.exitcode}), restarting")
+                        self._spawn(shard_id)
+                        by_shard[shard_id] = []
+
+                if time.monotonic() > deadline:
+                    missing = [shard_id for shard_id in range(len(self._workers)) if shard_id not in by_shard]
+                    print(f"⚠️ Watchlist check timed out waiting for shards {missing}, restarting them")
+                    for shard_id in missing:
+                        # kill, not terminate: a hung or stopped worker may ignore SIGTERM
+                        self._workers[shard_id].kill()
+                        self._workers[shard_id].join(timeout=5)
+                        self._spawn(shard_id)
+                    break
+                continue
+
+            if check_id == self._check_id:
+                by_shard[shard_id] = alerts
+
+        return [alert for shard_id in sorted(by_shard) for alert in by_shard[shard_id]]
+
+    def stop(self):
+        for commands in self._commands:
+            commands.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.kill()
+        self._workers.clear()
+        self._commands.clear()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()